@@ -9,6 +9,8 @@ from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
+from mpl_toolkits.mplot3d import proj3d
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
 from PySide6.QtCore import Qt, QTimer
 
 from PySide6.QtWidgets import (
@@ -17,54 +19,99 @@ from PySide6.QtWidgets import (
     QHeaderView, QSplitter, QComboBox, QCheckBox
 )
 
-# VisualizationWorker class for threaded visualization computation
-from PySide6.QtCore import QThread, Signal
-
-class VisualizationWorker(QThread):
-    # Signal: (power_set_positions, binary_positions, n, current_index, show_labels, show_connections)
-    updated = Signal(list, list, int, int, bool, bool)
-
-    def __init__(self, base_set, current_index, show_labels, show_connections):
-        super().__init__()
-        self.base_set = base_set
-        self.current_index = current_index
-        self.show_labels = show_labels
-        self.show_connections = show_connections
-
-    def run(self):
-        n = len(self.base_set)
-        power_set_positions = []
-        binary_positions = []
-        for i in range(2 ** n):
-            # Allow early exit if interrupted
-            if self.isInterruptionRequested():
-                return
-
-            theta = (i / (2 ** n)) * 2 * np.pi
-            phi = np.pi / 3
-            x = np.sin(phi) * np.cos(theta)
-            y = np.sin(phi) * np.sin(theta)
-            z = np.cos(phi)
-            power_set_positions.append((x, y, z))
-
-            phi2 = np.pi - phi
-            x2 = np.sin(phi2) * np.cos(theta)
-            y2 = np.sin(phi2) * np.sin(theta)
-            z2 = np.cos(phi2)
-            binary_positions.append((x2, y2, z2))
-
-        # Check one more time before emitting
-        if self.isInterruptionRequested():
-            return
-
-        self.updated.emit(
-            power_set_positions,
-            binary_positions,
-            n,
-            self.current_index,
-            self.show_labels,
-            self.show_connections
-        )
+# Below this many nodes NumPy is faster than paying the JIT warm-up
+NUMBA_MIN_POINTS = 512
+
+# Compiled position kernel, built on first use; False once numba turned out to be unavailable
+_numba_kernel = None
+
+
+def _get_numba_kernel():
+    # numba is optional and slow to import, so it is only loaded once a set is large enough to use it
+    global _numba_kernel
+    if _numba_kernel is None:
+        try:
+            from numba import njit, prange
+        except ImportError:
+            _numba_kernel = False
+            return None
+
+        @njit(cache=True, parallel=True)
+        def compute_positions_kernel(phi, power_set_positions, binary_positions):
+            # Fills both preallocated (N, 3) arrays in place, see compute_positions for the layout
+            count = power_set_positions.shape[0]
+            step = 2 * np.pi / count
+            sin_phi = np.sin(phi)
+            cos_phi = np.cos(phi)
+            for i in prange(count):
+                theta = i * step
+                x = sin_phi * np.cos(theta)
+                y = sin_phi * np.sin(theta)
+                power_set_positions[i, 0] = x
+                power_set_positions[i, 1] = y
+                power_set_positions[i, 2] = cos_phi
+                binary_positions[i, 0] = x
+                binary_positions[i, 1] = y
+                binary_positions[i, 2] = -cos_phi
+
+        _numba_kernel = compute_positions_kernel
+    return _numba_kernel or None
+
+
+def compute_positions(n):
+    # Node positions for the power-set (upper) and binary-string (lower) hemispheres, float32 of shape (2**n, 3)
+    count = 1 << n
+    phi = np.pi / 3
+
+    # Write straight into the final contiguous arrays rather than stacking temporaries
+    power_set_positions = np.empty((count, 3), dtype=np.float32)
+    binary_positions = np.empty_like(power_set_positions)
+
+    # Compiled parallel kernel for large sets, if numba is installed
+    kernel = _get_numba_kernel() if count > NUMBA_MIN_POINTS else None
+    if kernel is not None:
+        kernel(phi, power_set_positions, binary_positions)
+        return power_set_positions, binary_positions
+
+    # Evaluate all angles at once instead of calling the trig ufuncs per point. float32 is
+    # plenty for a unit sphere and halves the data pushed through the 3D projection.
+    theta = np.arange(count, dtype=np.float32) * (2 * np.pi / count)
+    sin_phi = np.float32(np.sin(phi))
+    power_set_positions[:, 0] = sin_phi * np.cos(theta)
+    power_set_positions[:, 1] = sin_phi * np.sin(theta)
+    power_set_positions[:, 2] = np.cos(phi)
+
+    # The binary hemisphere is the reflection phi -> pi - phi. Since sin(pi - phi) == sin(phi)
+    # and cos(pi - phi) == -cos(phi), it shares x and y and only negates z.
+    binary_positions[:, :2] = power_set_positions[:, :2]
+    binary_positions[:, 2] = -power_set_positions[:, 2]
+    return power_set_positions, binary_positions
+
+
+def build_binary_strings(n):
+    # Zero-padded binary strings of 0 .. 2**n - 1
+    return [bin(i)[2:].zfill(n) for i in range(2 ** n)]
+
+
+def build_power_set_labels(base_set, binaries):
+    # (binary strings, subsets, subset strings) for base_set, given the binary strings for its size
+    n = len(base_set)
+    # Bit matrix of every index, most significant bit first (n is capped at 6, so uint8 suffices)
+    bits = np.unpackbits(np.arange(2 ** n, dtype=np.uint8)[:, None], axis=1)[:, 8 - n:]
+
+    # Create each subset from the set bits of its row
+    subsets = [[base_set[j] for j in np.flatnonzero(row)] for row in bits]
+
+    # Format the subsets as strings
+    subset_strs = ["{" + ", ".join(subset) + "}" if subset else "∅" for subset in subsets]
+
+    return binaries, subsets, subset_strs
+
+
+# Labels and positions for the default 3-element set, built once at import so the first paint is a cache lookup
+_DEFAULT_BASE_SET = ("x₁", "x₂", "x₃")
+_DEFAULT_LABELS = build_power_set_labels(_DEFAULT_BASE_SET, build_binary_strings(len(_DEFAULT_BASE_SET)))
+_DEFAULT_POSITIONS = compute_positions(len(_DEFAULT_BASE_SET))
 
 
 class PowerSetBijectionVisualization(QMainWindow):
@@ -83,13 +130,40 @@ class PowerSetBijectionVisualization(QMainWindow):
         self.current_subset_label = None
         self.current_binary_label = None
         self.current_decimal_label = None
-        self.worker = None
+
+        # Binary and subset strings of the current base set, shared by the table and the plot labels
+        self._labels_cache = {}
+        # Binary strings only depend on the set size, so they are shared across base sets
+        self._bin_cache = {}
+        # Node positions only depend on the set size, so they are computed once per n
+        self._pos_cache = {}
+        self._visualization_pending = False
+        # Set while the animation moves the table selection, which redraws the plot itself
+        self._animation_selecting = False
+        # Artists from the last full draw, recolored in place when only the selection changes
+        self._drawn_key = None
+        self._drawn_count = 0
+        self._drawn_index = 0
+        self._power_set_scatter = None
+        self._binary_scatter = None
+        self._power_set_texts = []
+        self._binary_texts = []
+        self._connections = None
+        # Every artist created by draw_visualization, removed on the next full draw
+        self._artists = []
+        self._base_set_text = None
+        self._formal_def_text = None
+        # Canvas snapshot without the highlight-carrying (animated) artists, used for blitting
+        self._background = None
+        # Node label anchors, (2N, 3), and the projection they were last laid out for
+        self._label_positions = None
+        self._labels_proj = None
 
         self.setWindowTitle("Power Set Bijection Visualization")
         self.setMinimumSize(1200, 800)
 
         # Data model
-        self.base_set = ["x₁", "x₂", "x₃"]
+        self.base_set = list(_DEFAULT_BASE_SET)
         self.set_size = 3
         self.selected_subset = []
         self.current_binary = "000"
@@ -99,6 +173,11 @@ class PowerSetBijectionVisualization(QMainWindow):
         self.animation_index = 0
         self.animation_running = False
 
+        # Seed the caches for the default set before the first update
+        self._labels_cache[_DEFAULT_BASE_SET] = _DEFAULT_LABELS
+        self._bin_cache[len(_DEFAULT_BASE_SET)] = _DEFAULT_LABELS[0]
+        self._pos_cache[len(_DEFAULT_BASE_SET)] = _DEFAULT_POSITIONS
+
         # Create UI
         self.init_ui()
 
@@ -197,8 +276,24 @@ class PowerSetBijectionVisualization(QMainWindow):
         # Right panel (3D visualization)
         self.canvas = FigureCanvas(Figure(figsize=(8, 8)))
         self.ax = self.canvas.figure.add_subplot(111, projection='3d')
+
+        # Configure axes once; redraws only replace the artists they own
+        self.ax.set_xlim([-1.5, 1.5])
+        self.ax.set_ylim([-1.5, 1.5])
+        self.ax.set_zlim([-1.5, 1.5])
+        self.ax.set_xlabel('X')
+        self.ax.set_ylabel('Y')
+        self.ax.set_zlabel('Z')
+        self.ax.set_title('Power Set to Binary String Bijection')
+
+        # Base set label at top and formal definition at bottom, updated by draw_visualization
+        self._base_set_text = self.ax.text(0, 0, 1.8, "", fontsize=10, ha='center', va='center')
+        self._formal_def_text = self.ax.text(0, 0, -1.8, "", fontsize=10, ha='center', va='center')
+
         # Enable point picking on the 3D canvas
         self.canvas.mpl_connect('pick_event', self.on_pick)
+        # Capture the static background after every full draw for blitted highlight updates
+        self.canvas.mpl_connect('draw_event', self.on_canvas_draw)
 
         # Current selection display
         selection_widget = QWidget()
@@ -235,56 +330,80 @@ class PowerSetBijectionVisualization(QMainWindow):
         # Update base set with proper subscripts
         subscripts = ["₁", "₂", "₃", "₄", "₅", "₆", "₇", "₈"]
         self.base_set = [f"x{subscripts[i]}" for i in range(min(value, 8))]
+        # Don't let the programmatic text change re-enter elements_changed
+        self.elements_input.blockSignals(True)
         self.elements_input.setText(", ".join(self.base_set))
-        self.selected_subset = []
-        self.current_binary = "0" * value
-        self.update_power_set()
-        self.update_3d_visualization()
+        self.elements_input.blockSignals(False)
+        self._rebuild()
 
     def elements_changed(self, text):
         elements = [e.strip() for e in text.split(",") if e.strip()]
         if len(elements) > 0:
             self.base_set = elements[:min(len(elements), 6)]  # Limit to 6 elements
             self.set_size = len(self.base_set)
+            # Don't let the programmatic value change re-enter set_size_changed
+            self.size_spinner.blockSignals(True)
             self.size_spinner.setValue(self.set_size)
-            self.selected_subset = []
-            self.current_binary = "0" * self.set_size
-            self.update_power_set()
-            self.update_3d_visualization()
-
-    def update_power_set(self):
-        # Generate all possible subsets and their binary representations
-        power_set = []
-        n = len(self.base_set)
-
-        for i in range(2 ** n):
-            # Convert i to binary string with leading zeros
-            binary = format(i, f'0{n}b')
-
-            # Create the subset based on the binary string
-            subset = [self.base_set[j] for j in range(n) if binary[j] == '1']
+            self.size_spinner.blockSignals(False)
+            self._rebuild()
 
-            # Format the subset as a string
-            if len(subset) == 0:
-                subset_str = "∅"
-            else:
-                subset_str = "{" + ", ".join(subset) + "}"
-
-            power_set.append((subset, subset_str, binary, i))
+    def _rebuild(self):
+        # Reset the selection and refresh the table and plot once for the new base set
+        self.selected_subset = []
+        self.current_binary = "0" * self.set_size
+        self.update_power_set()
+        self.update_3d_visualization()
 
-        # Update the table
-        self.power_set_table.setRowCount(len(power_set))
-        for row, (subset, subset_str, binary, decimal) in enumerate(power_set):
-            self.power_set_table.setItem(row, 0, QTableWidgetItem(subset_str))
-            self.power_set_table.setItem(row, 1, QTableWidgetItem(binary))
-            self.power_set_table.setItem(row, 2, QTableWidgetItem(str(decimal)))
+    def binary_strings(self, n):
+        # Return the zero-padded binary strings of 0 .. 2**n - 1, building them once per set size
+        binaries = self._bin_cache.get(n)
+        if binaries is None:
+            binaries = build_binary_strings(n)
+            self._bin_cache[n] = binaries
+        return binaries
+
+    def power_set_labels(self):
+        # Return (binary strings, subsets, subset strings) for the current base set, building them once
+        key = tuple(self.base_set)
+        labels = self._labels_cache.get(key)
+        if labels is None:
+            labels = build_power_set_labels(self.base_set, self.binary_strings(len(self.base_set)))
+            # Only the current base set is ever read back, and typing the elements creates a
+            # new key per keystroke, so keep just the latest entry
+            self._labels_cache.clear()
+            self._labels_cache[key] = labels
+        return labels
 
-        # Highlight the current selection
-        for row in range(self.power_set_table.rowCount()):
-            binary_item = self.power_set_table.item(row, 1)
-            if binary_item and binary_item.text() == self.current_binary:
-                self.power_set_table.selectRow(row)
-                break
+    def update_power_set(self):
+        # Generate all possible subsets and their binary representations
+        binaries, _subsets, subset_strs = self.power_set_labels()
+
+        # Update the table in one batch, reusing existing items instead of reallocating them
+        table = self.power_set_table
+        selection_model = table.selectionModel()
+        table.setUpdatesEnabled(False)
+        # Resizing the table can change the selection; silence the selection model (a separate
+        # QObject from the table) so table_selection_changed never sees a half-written table
+        selection_model.blockSignals(True)
+        try:
+            if table.rowCount() != len(binaries):
+                table.setRowCount(len(binaries))
+            for row, (subset_str, binary) in enumerate(zip(subset_strs, binaries)):
+                for column, text in enumerate((subset_str, binary, str(row))):
+                    item = table.item(row, column)
+                    if item is None:
+                        table.setItem(row, column, QTableWidgetItem(text))
+                    else:
+                        item.setText(text)
+        finally:
+            selection_model.blockSignals(False)
+            table.setUpdatesEnabled(True)
+
+        # Highlight the current selection; rows are ordered by decimal value. Clear it first so
+        # selectRow always emits and table_selection_changed refreshes the labels from the new rows.
+        if self.current_binary:
+            table.clearSelection()
+            table.selectRow(int(self.current_binary, 2))
 
     def table_selection_changed(self, selected, _deselected) -> None:
         indices = selected.indexes()
@@ -295,15 +414,8 @@ class PowerSetBijectionVisualization(QMainWindow):
             decimal_val = self.power_set_table.item(row, 2).text()
 
             # Update current selection
-            if subset_str == "∅":
-                self.selected_subset = []
-            else:
-                # Remove braces and split by comma
-                subset_content = subset_str[1:-1].strip()
-                if subset_content:
-                    self.selected_subset = [item.strip() for item in subset_content.split(',')]
-                else:
-                    self.selected_subset = []
+            _binaries, subsets, _subset_strs = self.power_set_labels()
+            self.selected_subset = list(subsets[row])
 
             self.current_binary = binary_str
 
@@ -313,104 +425,167 @@ class PowerSetBijectionVisualization(QMainWindow):
             self.current_decimal_label.setText(f"Decimal: {decimal_val}")
 
             # Update 3D visualization highlighting
-            self.update_3d_visualization()
+            if not self._animation_selecting:
+                self.update_3d_visualization()
 
     def update_3d_visualization(self) -> None:
-        # Stop previous worker if it's still running
-        if getattr(self, 'worker', None) is not None and self.worker.isRunning():
-            self.worker.quit()
-            self.worker.wait()
+        # Coalesce bursts of requests (checkbox toggles, selection changes) into one redraw
+        if self._visualization_pending:
+            return
+        self._visualization_pending = True
+        QTimer.singleShot(0, self._refresh_3d_visualization)
+
+    def _refresh_3d_visualization(self) -> None:
+        self._visualization_pending = False
         # Determine which index is selected and which flags are checked
+        n = len(self.base_set)
         current_index = int(self.current_binary, 2) if self.current_binary else 0
         show_labels = self.show_labels_checkbox.isChecked()
         show_connections = self.show_connections_checkbox.isChecked()
 
-        # Launch a worker thread to compute positions
-        self.worker = VisualizationWorker(
-            self.base_set,
-            current_index,
-            show_labels,
-            show_connections
-        )
-        # When worker finishes, call draw_visualization on the main thread
-        self.worker.updated.connect(self.draw_visualization)
-        self.worker.start()
+        # Positions are cheap to compute (at most 64 nodes), so do it on the main thread once per n
+        if n not in self._pos_cache:
+            self._pos_cache[n] = compute_positions(n)
+        self.draw_visualization(*self._pos_cache[n], n, current_index, show_labels, show_connections)
 
     def draw_visualization(self, power_set_positions, binary_positions, n, current_index, show_labels, show_connections) -> None:
-        # Clear any previous plot
-        self.ax.clear()
-
-        # Configure axes
-        self.ax.set_xlim([-1.5, 1.5])
-        self.ax.set_ylim([-1.5, 1.5])
-        self.ax.set_zlim([-1.5, 1.5])
-        self.ax.set_xlabel('X')
-        self.ax.set_ylabel('Y')
-        self.ax.set_zlabel('Z')
-        self.ax.set_title('Power Set to Binary String Bijection')
+        # Only the highlight changed since the last draw: recolor the existing artists
+        draw_key = (tuple(self.base_set), show_labels, show_connections)
+        if draw_key == self._drawn_key:
+            self._update_highlight(current_index)
+            self._blit_highlight()
+            return
 
-        # Plot each power-set node on the sphere
-        for i, (x, y, z) in enumerate(power_set_positions):
-            binary = format(i, f'0{n}b')
-            subset = [self.base_set[j] for j in range(n) if binary[j] == '1']
-            subset_str = "∅" if not subset else "{" + ", ".join(subset) + "}"
-
-            if i == current_index:
-                color, size = 'red', 100
-            else:
-                color, size = 'blue', 50
-
-            self.ax.scatter(x, y, z, color=color, s=size, picker=5)
-            if show_labels:
-                self.ax.text(x * 1.1, y * 1.1, z * 1.1, subset_str, color=color, fontsize=8)
-
-        # Plot each binary-string node on the opposite hemisphere
-        for i, (x2, y2, z2) in enumerate(binary_positions):
-            binary = format(i, f'0{n}b')
-            if i == current_index:
-                color, size = 'red', 100
-            else:
-                color, size = 'green', 50
-
-            self.ax.scatter(x2, y2, z2, color=color, s=size, picker=5)
-            if show_labels:
-                self.ax.text(x2 * 1.1, y2 * 1.1, z2 * 1.1, binary, color=color, fontsize=8)
-
-        # Draw connecting lines if requested
+        # Remove the artists of the previous draw instead of clearing and reconfiguring the axes
+        for artist in self._artists:
+            artist.remove()
+
+        binaries, _subsets, subset_strs = self.power_set_labels()
+        count = len(power_set_positions)
+        highlighted = np.arange(count) == current_index
+        sizes = np.where(highlighted, 100, 50)
+
+        # Plot all power-set nodes on the sphere as a single collection
+        power_set_colors = np.where(highlighted, 'red', 'blue')
+        self._power_set_scatter = self.ax.scatter(
+            power_set_positions[:, 0], power_set_positions[:, 1], power_set_positions[:, 2],
+            c=power_set_colors, s=sizes, depthshade=False, picker=5, animated=True)
+
+        # Plot all binary-string nodes on the opposite hemisphere as a single collection
+        binary_colors = np.where(highlighted, 'red', 'green')
+        self._binary_scatter = self.ax.scatter(
+            binary_positions[:, 0], binary_positions[:, 1], binary_positions[:, 2],
+            c=binary_colors, s=sizes, depthshade=False, picker=5, animated=True)
+
+        # Label every node with a plain 2D text; _layout_labels places them all at their
+        # projected positions with one transform instead of one projection per Text3D
+        self._power_set_texts = []
+        self._binary_texts = []
+        if show_labels:
+            self._label_positions = 1.1 * np.concatenate((power_set_positions, binary_positions))
+            self._power_set_texts = [
+                self.ax.text2D(0, 0, subset_str, transform=self.ax.transData, color=color, fontsize=8, animated=True)
+                for subset_str, color in zip(subset_strs, power_set_colors)]
+            self._binary_texts = [
+                self.ax.text2D(0, 0, binary, transform=self.ax.transData, color=color, fontsize=8, animated=True)
+                for binary, color in zip(binaries, binary_colors)]
+            self._labels_proj = None
+            self._layout_labels(self.ax.get_proj())
+
+        # Draw all connecting lines as a single collection if requested
+        self._connections = None
         if show_connections:
-            for i in range(2 ** n):
-                x1, y1, z1 = power_set_positions[i]
-                x2, y2, z2 = binary_positions[i]
-                if i == current_index:
-                    color, linewidth = 'red', 2
-                else:
-                    color, linewidth = 'gray', 0.5
-                self.ax.plot([x1, x2], [y1, y2], [z1, z2], color=color, linewidth=linewidth, alpha=0.5)
-
-        # Draw the base set label at top
-        self.ax.text(0, 0, 1.8, f"Base Set X = {{{', '.join(self.base_set)}}}", fontsize=10, ha='center', va='center')
-
-        # Draw the formal definition at bottom
-        formal_def = f"f: 2^X → {{0,1}}^{n} maps Y ⊆ X to binary string y₁y₂...y_{n}"
-        self.ax.text(0, 0, -1.8, formal_def, fontsize=10, ha='center', va='center')
-
-        # Finally redraw the canvas
-        self.canvas.draw()
+            segments = np.stack([power_set_positions, binary_positions], axis=1)
+            self._connections = Line3DCollection(
+                segments, colors=np.where(highlighted, 'red', 'gray'),
+                linewidths=np.where(highlighted, 2.0, 0.5), alpha=0.5, animated=True)
+            self.ax.add_collection3d(self._connections)
+
+        # Update the base set label at top
+        self._base_set_text.set_text(f"Base Set X = {{{', '.join(self.base_set)}}}")
+
+        # Update the formal definition at bottom
+        self._formal_def_text.set_text(f"f: 2^X → {{0,1}}^{n} maps Y ⊆ X to binary string y₁y₂...y_{n}")
+
+        self._artists = [self._power_set_scatter, self._binary_scatter, *self._power_set_texts, *self._binary_texts]
+        if self._connections is not None:
+            self._artists.append(self._connections)
+        self._drawn_key = draw_key
+        self._drawn_count = count
+        self._drawn_index = current_index
+
+        # Schedule a repaint; Qt coalesces it with any other pending paint events.
+        # The old background still contains the previous axes text, so it can't be blitted onto.
+        self._background = None
+        self.canvas.draw_idle()
+
+    def _update_highlight(self, current_index) -> None:
+        # Move the red highlight to current_index without recreating any artists
+        previous_index = self._drawn_index
+        self._drawn_index = current_index
+
+        highlighted = np.arange(self._drawn_count) == current_index
+        sizes = np.where(highlighted, 100, 50)
+        self._power_set_scatter.set_facecolors(np.where(highlighted, 'red', 'blue'))
+        self._power_set_scatter.set_sizes(sizes)
+        self._binary_scatter.set_facecolors(np.where(highlighted, 'red', 'green'))
+        self._binary_scatter.set_sizes(sizes)
+
+        for texts, color in ((self._power_set_texts, 'blue'), (self._binary_texts, 'green')):
+            if texts:
+                texts[previous_index].set_color(color)
+                texts[current_index].set_color('red')
+
+        if self._connections is not None:
+            self._connections.set_colors(np.where(highlighted, 'red', 'gray'))
+            self._connections.set_linewidths(np.where(highlighted, 2.0, 0.5))
+
+    def on_canvas_draw(self, event) -> None:
+        # Saving to a file draws animated artists like any other artist
+        if self.canvas.is_saving():
+            return
+        # Animated artists are skipped by the full draw: snapshot what was drawn, then paint them on top
+        self._background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self._layout_labels(self.ax.M)
+        self._draw_highlight_artists(event.renderer)
+
+    def _layout_labels(self, proj) -> None:
+        # Project all label anchors in one go, but only when the view actually changed
+        texts = self._power_set_texts + self._binary_texts
+        if not texts or (self._labels_proj is not None and np.array_equal(proj, self._labels_proj)):
+            return
+        xs, ys, _ = proj3d.proj_transform(*self._label_positions.T, proj)
+        for text, x, y in zip(texts, xs, ys):
+            text.set_position((x, y))
+        self._labels_proj = proj.copy()
+
+    def _draw_highlight_artists(self, renderer) -> None:
+        for artist in sorted(self._artists, key=lambda a: a.get_zorder()):
+            # Re-sort the collections' colors and sizes by depth for the current view
+            if hasattr(artist, 'do_3d_projection'):
+                artist.do_3d_projection()
+            artist.draw(renderer)
+
+    def _blit_highlight(self) -> None:
+        # Repaint only the highlight-carrying artists over the cached static background
+        if self._background is None or not self.canvas.supports_blit:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_highlight_artists(self.canvas.get_renderer())
+        self.canvas.blit(self.canvas.figure.bbox)
 
     def on_pick(self, event: object) -> None:
         # When a scatter point is clicked, update the table selection
         if not event.artist:
             return
-        ind = event.ind[0] if isinstance(event.ind, (list, tuple)) else event.ind
-        n = len(self.base_set)
-        binary = format(ind, f'0{n}b')
-        self.current_binary = binary
-        # Find and select the corresponding row in the table
-        for row in range(self.power_set_table.rowCount()):
-            if self.power_set_table.item(row, 1).text() == binary:
-                self.power_set_table.selectRow(row)
-                break
-        # Trigger a redraw via threaded mechanism
+        # Both scatter collections are ordered by decimal value, so the index is the subset
+        ind = int(event.ind[0])
+        binaries, _subsets, _subset_strs = self.power_set_labels()
+        self.current_binary = binaries[ind]
+        # Table rows are ordered by decimal value too
+        self.power_set_table.selectRow(ind)
+        # Trigger a redraw
         self.update_3d_visualization()
 
     def toggle_animation(self):
@@ -429,7 +604,21 @@ class PowerSetBijectionVisualization(QMainWindow):
         n = 2 ** len(self.base_set)
         next_index = (self.animation_index + 1) % n
         self.animation_index = next_index
-        self.power_set_table.selectRow(next_index)
+        self._animation_selecting = True
+        try:
+            self.power_set_table.selectRow(next_index)
+        finally:
+            self._animation_selecting = False
+
+        # Only the highlight moves between frames, so recolor the existing artists directly
+        # instead of going through a full update_3d_visualization pass
+        draw_key = (tuple(self.base_set), self.show_labels_checkbox.isChecked(),
+                    self.show_connections_checkbox.isChecked())
+        if draw_key == self._drawn_key and not self._visualization_pending:
+            self._update_highlight(next_index)
+            self._blit_highlight()
+        else:
+            self.update_3d_visualization()
 
     def speed_changed(self, index):
         speeds = [2000, 1000, 500]  # Slow, Medium, Fast in milliseconds
@@ -443,10 +632,6 @@ class PowerSetBijectionVisualization(QMainWindow):
         pass
 
     def closeEvent(self, event) -> None:
-        # Stop worker thread if running
-        if getattr(self, 'worker', None) is not None and self.worker.isRunning():
-            self.worker.quit()
-            self.worker.wait()
         # Stop animation timer if running
         if self.animation_running:
             self.animation_timer.stop()